@@ -23,14 +23,17 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import argparse
 import asyncio
+import atexit
 import json
 import logging
 import logging.handlers
 import os
+import queue
+import re
 import subprocess
 import sys
 import time
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, List, Sequence
 from mcp.server import Server
@@ -49,6 +52,22 @@ metrics: Dict[str, Any] = {
     "tool_calls_error": 0,
 }
 
+# Plugins directory used when MCP_PLUGINS_DIR is not set
+DEFAULT_PLUGINS_DIR = Path(__file__).parent / "plugins"
+
+# Maximum number of plugin help probes run concurrently during registration
+PLUGIN_HELP_WORKERS = 16
+
+# "Available commands:" header and the lines that follow it, up to the first
+# blank line or "Examples" line
+_COMMANDS_SECTION_RE = re.compile(
+    r"^[^\S\n]*Available commands:.*$((?:\n(?![^\S\n]*(?:Examples|$)).*)*)",
+    re.MULTILINE
+)
+# First word of an indented line inside the commands section
+_COMMAND_NAME_RE = re.compile(r"^  [^\S\n]*(\S+)", re.MULTILINE)
+_NON_COMMAND_WORDS = frozenset({"usage:", "options:", "Available", "Examples:"})
+
 # Configure logging
 def setup_logging():
     """Set up logging configuration."""
@@ -77,11 +96,19 @@ def setup_logging():
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(simple_formatter)
     
+    # Hand records to a background listener so callers on the event loop never
+    # block on file or console writes
+    log_queue = queue.SimpleQueue()
+    queue_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    queue_listener.start()
+    atexit.register(queue_listener.stop)
+    
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
     # Reduce noise from some libraries
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -101,25 +128,30 @@ def discover_plugins() -> Dict[str, Dict[str, Any]]:
         plugins_dir = Path(plugins_dir_env)
     else:
         # Use relative path from current script location
-        plugins_dir = Path(__file__).parent / "plugins"
+        plugins_dir = DEFAULT_PLUGINS_DIR
     plugins = {}
     
-    if not plugins_dir.exists():
+    # scandir reports entry types from the directory listing itself, so only
+    # plugin directories cost an extra stat (for their cli.py)
+    try:
+        entries = os.scandir(plugins_dir)
+    except (FileNotFoundError, NotADirectoryError):
         logger.warning(f"Plugins directory not found: {plugins_dir}")
         return plugins
     
     logger.info("Discovering plugins...")
     
-    for plugin_dir in plugins_dir.iterdir():
-        if plugin_dir.is_dir():
-            cli_path = plugin_dir / "cli.py"
-            if cli_path.exists():
-                plugin_name = plugin_dir.name
-                plugins[plugin_name] = {
-                    "path": str(cli_path),
-                    "commands": {}
-                }
-                logger.info(f"Discovered plugin: {plugin_name}")
+    with entries:
+        for entry in entries:
+            if entry.is_dir():
+                cli_path = Path(entry.path) / "cli.py"
+                if cli_path.exists():
+                    plugin_name = entry.name
+                    plugins[plugin_name] = {
+                        "path": str(cli_path),
+                        "commands": {}
+                    }
+                    logger.info(f"Discovered plugin: {plugin_name}")
     
     metrics["plugins_discovered"] = len(plugins)
     logger.info(f"Discovered {len(plugins)} plugins: {list(plugins.keys())}")
@@ -200,6 +232,16 @@ async def execute_plugin_tool(tool_name: str, arguments: dict) -> str:
         return error_msg
 
 
+def parse_plugin_commands(help_text: str) -> List[str]:
+    """Extract command names from the "Available commands:" section of plugin help."""
+    commands = []
+    for section in _COMMANDS_SECTION_RE.finditer(help_text):
+        for name in _COMMAND_NAME_RE.findall(section.group(1)):
+            if name not in _NON_COMMAND_WORDS:
+                commands.append(name)
+    return commands
+
+
 def create_tool_from_plugin(plugin_name: str, command: str) -> Tool:
     """Create an MCP Tool from a plugin command."""
     tool_name = f"{plugin_name}.{command}"
@@ -231,44 +273,36 @@ def register_plugin_tools(server: Server):
     # Collect all tools
     all_tools = []
     
+    # Probe every plugin's help concurrently; each probe starts a fresh
+    # interpreter, so doing them one at a time scales with the plugin count
+    with ThreadPoolExecutor(max_workers=PLUGIN_HELP_WORKERS) as executor:
+        help_texts = dict(zip(
+            plugin_registry,
+            executor.map(
+                lambda item: get_plugin_help(item[0], item[1]["path"]),
+                plugin_registry.items()
+            )
+        ))
+    
     # Create tools for each plugin
-    for plugin_name, plugin_info in plugin_registry.items():
-        cli_path = plugin_info["path"]
-        
-        # Get help to extract available commands
-        help_text = get_plugin_help(plugin_name, cli_path)
-        lines = help_text.split('\n')
-        in_commands_section = False
-        
-        for line in lines:
-            if line.strip().startswith("Available commands:"):
-                in_commands_section = True
-                continue
-            if in_commands_section:
-                # End of commands section if we hit an empty line or Examples
-                if not line.strip() or line.strip().startswith("Examples"):
-                    in_commands_section = False
-                    continue
-                if line.startswith('  '):
-                    parts = line.strip().split()
-                    if parts and parts[0] not in ['usage:', 'options:', 'Available', 'Examples:']:
-                        command = parts[0]
-                        
-                        # Create tool
-                        tool = create_tool_from_plugin(plugin_name, command)
-                        all_tools.append(tool)
-                        
-                        logger.info(f"Created tool: {tool.name}")
-                        metrics["tools_registered"] += 1
+    for plugin_name in plugin_registry:
+        for command in parse_plugin_commands(help_texts[plugin_name]):
+            # Create tool
+            tool = create_tool_from_plugin(plugin_name, command)
+            all_tools.append(tool)
+            
+            logger.info(f"Created tool: {tool.name}")
+            logger.debug(f"Tool {tool.name} schema: {tool.inputSchema}")
+            metrics["tools_registered"] += 1
+    
+    # The tool list is fixed after registration, so build its summary once
+    tool_names = [tool.name for tool in all_tools]
     
     # Register the list_tools handler
     @server.list_tools()
     async def list_tools_handler():
         """Return the list of available tools."""
-        logger.info(f"Returning {len(all_tools)} tools: {[tool.name for tool in all_tools]}")
-        # Log the actual tool schemas for debugging
-        for tool in all_tools:
-            logger.info(f"Tool {tool.name} schema: {tool.inputSchema}")
+        logger.info(f"Returning {len(tool_names)} tools: {tool_names}")
         return all_tools
     
     # Register the call_tool handler
@@ -431,8 +465,14 @@ async def async_main():
 
 def main():
     """Synchronous entry point for console script."""
-    asyncio.run(async_main())
+    # Use uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(async_main())
+    else:
+        uvloop.run(async_main())
 
 
 if __name__ == "__main__":
-    asyncio.run(async_main())
+    main()
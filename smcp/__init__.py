@@ -4,19 +4,27 @@ SMCP Package - Animus Letta MCP Server
 This package provides the main MCP server functionality.
 """
 
+import importlib.util
 import sys
-import os
 from pathlib import Path
 
-# Add the parent directory to the path so we can import smcp.py
-parent_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(parent_dir))
+# Load smcp.py (the file, not this package) by location instead of adding its
+# directory to sys.path. The module is cached in sys.modules so later imports
+# reuse it rather than executing the file again.
+_SERVER_MODULE = "smcp_module"
 
-# Import the main function from smcp.py (the file, not this package)
-import importlib.util
-spec = importlib.util.spec_from_file_location("smcp_module", parent_dir / "smcp.py")
-smcp_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(smcp_module)
+smcp_module = sys.modules.get(_SERVER_MODULE)
+if smcp_module is None:
+    spec = importlib.util.spec_from_file_location(
+        _SERVER_MODULE, Path(__file__).parent.parent / "smcp.py"
+    )
+    smcp_module = importlib.util.module_from_spec(spec)
+    sys.modules[_SERVER_MODULE] = smcp_module
+    try:
+        spec.loader.exec_module(smcp_module)
+    except BaseException:
+        del sys.modules[_SERVER_MODULE]
+        raise
 
 # Export the main function
 main = smcp_module.main
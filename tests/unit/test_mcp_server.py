@@ -24,6 +24,7 @@ spec.loader.exec_module(smcp_module)
 discover_plugins = smcp_module.discover_plugins
 get_plugin_help = smcp_module.get_plugin_help
 execute_plugin_tool = smcp_module.execute_plugin_tool
+parse_plugin_commands = smcp_module.parse_plugin_commands
 create_tool_from_plugin = smcp_module.create_tool_from_plugin
 register_plugin_tools = smcp_module.register_plugin_tools
 plugin_registry = smcp_module.plugin_registry
@@ -76,7 +77,32 @@ class TestPluginDiscovery:
             plugins = discover_plugins()
             
         assert plugins == {}
-    
+
+    def test_discover_plugins_path_is_file(self, tmp_path):
+        """Test plugin discovery when MCP_PLUGINS_DIR points at a file."""
+        plugins_file = tmp_path / "plugins.txt"
+        plugins_file.write_text("not a directory")
+
+        with patch.dict(os.environ, {"MCP_PLUGINS_DIR": str(plugins_file)}):
+            plugins = discover_plugins()
+
+        assert plugins == {}
+
+    def test_discover_plugins_ignores_files(self, tmp_path):
+        """Test plugin discovery skips plain files in the plugins directory."""
+        plugins_dir = tmp_path / "test_plugins"
+        plugins_dir.mkdir()
+        (plugins_dir / "README.md").write_text("# Plugins")
+
+        plugin_dir = plugins_dir / "test_plugin"
+        plugin_dir.mkdir()
+        (plugin_dir / "cli.py").write_text("# Test plugin")
+
+        with patch.dict(os.environ, {"MCP_PLUGINS_DIR": str(plugins_dir)}):
+            plugins = discover_plugins()
+
+        assert list(plugins) == ["test_plugin"]
+
     def test_discover_plugins_empty_directory(self, tmp_path):
         """Test plugin discovery with empty directory."""
         plugins_dir = tmp_path / "empty_plugins"
@@ -212,6 +238,42 @@ class TestToolExecution:
         assert "Error executing tool" in result
 
 
+@pytest.mark.unit
+class TestCommandParsing:
+    """Test extraction of commands from plugin help output."""
+    
+    def test_parse_plugin_commands(self):
+        """Test parsing a typical argparse epilog."""
+        help_text = (
+            "usage: cli.py [-h] {deploy,status} ...\n"
+            "\n"
+            "Available commands:\n"
+            "  deploy      Deploy an application\n"
+            "  status      Get deployment status\n"
+            "\n"
+            "Examples:\n"
+            "  python cli.py deploy --app-name myapp\n"
+        )
+        
+        assert parse_plugin_commands(help_text) == ["deploy", "status"]
+    
+    def test_parse_plugin_commands_stops_at_examples(self):
+        """Test that the commands section ends at an Examples line."""
+        help_text = "Available commands:\n  deploy\nExamples:\n  python cli.py deploy"
+        
+        assert parse_plugin_commands(help_text) == ["deploy"]
+    
+    def test_parse_plugin_commands_windows_line_endings(self):
+        """Test parsing help output with CRLF line endings."""
+        help_text = "Available commands:\r\n  deploy  Deploy\r\n  status\r\n\r\n  ignored\r\n"
+        
+        assert parse_plugin_commands(help_text) == ["deploy", "status"]
+    
+    def test_parse_plugin_commands_no_section(self):
+        """Test parsing help output without a commands section."""
+        assert parse_plugin_commands("Just some help text\n  indented") == []
+
+
 @pytest.mark.unit
 class TestToolCreation:
     """Test tool creation functionality."""
@@ -288,5 +350,26 @@ class TestToolRegistration:
             mock_server.list_tools.assert_called_once()
             mock_server.call_tool.assert_called_once()
 
+    @patch.object(smcp_module, "discover_plugins")
+    @patch.object(smcp_module, "get_plugin_help")
+    def test_register_plugin_tools_probes_every_plugin(self, mock_help, mock_discover):
+        """Test that help is fetched once for every discovered plugin."""
+        mock_discover.return_value = {
+            f"plugin_{i}": {"path": f"/path/to/plugin_{i}/cli.py"}
+            for i in range(5)
+        }
+        mock_help.return_value = "Available commands:\n  test-command"
+
+        mock_server = Mock()
+
+        with patch.object(smcp_module, "plugin_registry", {}):
+            register_plugin_tools(mock_server)
+
+        assert mock_help.call_count == 5
+        called = {call.args for call in mock_help.call_args_list}
+        assert called == {
+            (f"plugin_{i}", f"/path/to/plugin_{i}/cli.py") for i in range(5)
+        }
+
 
 # Health check tests removed - health_check function doesn't exist in current server implementation 
\ No newline at end of file